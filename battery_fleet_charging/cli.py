@@ -0,0 +1,263 @@
+# python basics
+import argparse
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+# only pulls in enum, the src package resolves its other names lazily
+from .src.strategy_type import OptimizationStrategy
+
+# pandas, pydantic and the rest of the internal packages are imported
+# inside run() so that --help and --validate-only return without them
+
+
+# default configurations, used for any key the config file leaves out
+DEFAULT_CONFIGS = {
+    'input_data_path': 'data/load_data.csv',
+
+    # battery config
+    'capacity_kwh': 200,
+    'max_charge_rate_kw': 100,
+    'max_discharge_rate_kw': 100,
+    'charge_efficiency_pct': 97,
+    'discharge_efficiency_pct': 97,
+    'initial_state_of_energy': 0,
+
+    # optimization config
+    'optimization_strategy': 'OPT1', # OPT1 or OPT3
+
+    # viewing config
+    'print_results': True,
+    'save_battery_plan': True,
+    'save_file_path': 'data/outputs/battery_plan.csv',
+}
+
+# placeholder strategies are left out, they cannot produce a plan
+STRATEGY_NAMES = {
+    name for name, strategy in OptimizationStrategy.__members__.items()
+    if strategy.is_implemented
+}
+
+NUMERIC_KEYS = {
+    'capacity_kwh',
+    'max_charge_rate_kw',
+    'max_discharge_rate_kw',
+    'charge_efficiency_pct',
+    'discharge_efficiency_pct',
+    'initial_state_of_energy',
+}
+STRING_KEYS = {
+    'input_data_path',
+    'optimization_strategy',
+    'save_file_path',
+}
+BOOLEAN_KEYS = {
+    'print_results',
+    'save_battery_plan',
+}
+
+
+def load_configs(config_path: Optional[str]) -> Dict:
+    """
+    reads a TOML or JSON config file (picked by the file extension)
+    on top of DEFAULT_CONFIGS. With no path, the defaults are used.
+
+    Raises:
+        ValueError: If the file type is not supported or the file
+            does not hold a table/object of configurations
+    """
+    configs = dict(DEFAULT_CONFIGS)
+    if config_path is None:
+        return configs
+
+    extension = os.path.splitext(config_path)[1].lower()
+    if extension == '.json':
+        with open(config_path) as config_file:
+            loaded_configs = json.load(config_file)
+    elif extension == '.toml':
+        try:
+            import tomllib
+        except ImportError: # python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    "reading .toml configs needs python 3.11+ or the "
+                    "tomli package, use a .json config instead")
+        with open(config_path, 'rb') as config_file:
+            loaded_configs = tomllib.load(config_file)
+    else:
+        raise ValueError(
+            f"unsupported config file type: {extension}, "
+            f"use .toml or .json")
+
+    if not isinstance(loaded_configs, dict):
+        raise ValueError(
+            f"{config_path} should hold a table of configurations")
+    configs.update(loaded_configs)
+    return configs
+
+
+def validate_configs(configs: Dict) -> None:
+    """
+    cheap checks of the config values that do not need the heavy
+    imports. The battery is validated again by the Battery pydantic
+    class once the optimization runs.
+
+    Raises:
+        ValueError: If a key is unknown or a value is invalid
+    """
+    unknown_keys = set(configs) - set(DEFAULT_CONFIGS)
+    if unknown_keys:
+        raise ValueError(f"unknown config keys: {sorted(unknown_keys)}")
+
+    for key in NUMERIC_KEYS:
+        # bool is a subclass of int, but True is not a capacity
+        if isinstance(configs[key], bool) or \
+                not isinstance(configs[key], (int, float)):
+            raise ValueError(f"{key} should be a number")
+    for key in STRING_KEYS:
+        if not isinstance(configs[key], str):
+            raise ValueError(f"{key} should be a string")
+    for key in BOOLEAN_KEYS:
+        if not isinstance(configs[key], bool):
+            raise ValueError(f"{key} should be true or false")
+
+    for key in ('capacity_kwh', 'max_charge_rate_kw',
+                'max_discharge_rate_kw'):
+        if not configs[key] > 0:
+            raise ValueError(f"{key} should be greater than 0")
+    for key in ('charge_efficiency_pct', 'discharge_efficiency_pct'):
+        if not 0 < configs[key] <= 100:
+            raise ValueError(f"{key} not within the range")
+    if not 0 <= configs['initial_state_of_energy'] \
+            <= configs['capacity_kwh']:
+        raise ValueError("invalid state of charge")
+    if configs['optimization_strategy'] not in STRATEGY_NAMES:
+        raise ValueError(
+            f"optimization_strategy should be one of "
+            f"{sorted(STRATEGY_NAMES)}")
+    if not os.path.isfile(configs['input_data_path']):
+        raise ValueError(
+            f"input data not found: {configs['input_data_path']}")
+
+
+def run(configs: Dict) -> None:
+    """
+    reads the data, optimizes the battery plan and saves/prints
+    the results as requested in the configurations.
+    """
+    # repo dependencies
+    import pandas as pd
+    pd.set_option('display.max_rows', 300)
+    pd.set_option('display.max_columns', 300)
+    #pd.set_option('display.width', 500)
+
+    #internal packages
+    from .src import (
+        Battery,
+        DataPrep
+    )
+    from .core import (
+        DCMOptimizer,
+        OptimizationStrategy
+    )
+
+    # read data
+    logging.info("starting to read data ...")
+    gross_load_kw_df = pd.read_csv(configs['input_data_path'])
+    logging.info("finished reading data.")
+
+    # create a pydantic instance for timeseries and validation
+    input_data_container = DataPrep(
+        gross_load_kw_df=gross_load_kw_df
+        )
+
+    input_data_container.clean_data()
+
+    # create a pydantic instance for battery and validate
+    battery = Battery(
+            capacity_kwh=configs['capacity_kwh'],
+            max_charge_rate_kw=configs['max_charge_rate_kw'],
+            max_discharge_rate_kw=configs['max_discharge_rate_kw'],
+            charge_efficiency_pct=configs['charge_efficiency_pct'],
+            discharge_efficiency_pct=configs['discharge_efficiency_pct'],
+            initial_state_of_energy=configs['initial_state_of_energy']
+    )
+
+    # instantiate the optimization model
+    model = DCMOptimizer(
+        input_data=input_data_container,
+        battery=battery
+        )
+
+    logging.info("starting to optimize ...")
+    battery_plan_df = \
+        model.optimize(
+        time_increaments_minutes= model.get_granularity(),
+        optimization_strategy=\
+            OptimizationStrategy[configs['optimization_strategy']]
+        )
+    logging.info("optimization is done.")
+
+    if configs['save_battery_plan']:
+        battery_plan_df.to_csv(configs['save_file_path'])
+    if configs['print_results']:
+
+        logging.critical(battery_plan_df.head(10))
+
+        logging.critical(
+            f"the time granularity of the results is "
+            f"{model.get_granularity()} minutes.")
+
+        logging.critical(
+            f"the peak load (kwh) by month is "
+            f"{model.get_peak_by_month()}.")
+
+        logging.critical(
+            f"the time reduction percentage by month is "
+            f"{model.get_reduction_by_month()}.")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='battery-plan',
+        description='schedules the battery to shave the peaks of the '
+                    'gross load.')
+    parser.add_argument(
+        'config', nargs='?', default=None,
+        help='path to a .toml or .json config file, '
+             'keys that are left out take their default values')
+    parser.add_argument(
+        '--strategy', choices=sorted(STRATEGY_NAMES),
+        help='overrides optimization_strategy of the config')
+    parser.add_argument(
+        '--validate-only', action='store_true',
+        help='validates the config and exits without optimizing')
+    parser.add_argument(
+        '--log-level', default='INFO',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        help='logging level (default: INFO)')
+    args = parser.parse_args(argv)
+
+    # the only place logging is configured
+    logging.basicConfig(level=args.log_level)
+
+    try:
+        configs = load_configs(args.config)
+        if args.strategy is not None:
+            configs['optimization_strategy'] = args.strategy
+        validate_configs(configs)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    if args.validate_only:
+        logging.info("the config is valid.")
+        return
+
+    run(configs)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,14 +3,13 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List
 import logging
-logging.basicConfig(level=logging.DEBUG)
 
 # repo dependencies
 import pandas as pd
 import numpy as np
 
 # internal packages
-from src import (
+from ..src import (
     DataPrep,
     Battery,
     OptimizationStrategy
@@ -95,7 +94,9 @@ class DCMOptimizer():
             optimization_strategy: user specified optimization sgtrategy
 
         Returns:
-            a timeseries to optimally schedule the battery
+            a timeseries to optimally schedule the battery. For every
+            strategy, charge_kwh is negative and lowers the net load,
+            discharge_kwh is positive and raises it
         """
         assert optimization_strategy in OptimizationStrategy, \
             "the requested optimization strategy does not exist"
@@ -116,6 +117,9 @@ class DCMOptimizer():
         elif optimization_strategy == OptimizationStrategy.OPT2:
             self.battery_plan_df = \
                 self.optimizer.some_other_optimization()
+        elif optimization_strategy == OptimizationStrategy.OPT3:
+            self.battery_plan_df = \
+                self.optimizer.peak_shaving_level_optimization()
         
         # massage battery plan and add net load
         self.battery_plan_df = self.calculate_net_load()
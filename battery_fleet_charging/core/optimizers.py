@@ -0,0 +1,342 @@
+
+# python basics
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from enum import Enum
+from typing import Dict, List
+import logging
+
+
+# repo dependencies
+import pandas as pd
+import numpy as np
+
+# internal packages
+from ..src import OptimizationStrategy
+
+@dataclass
+class Optimizers():
+    strategy: OptimizationStrategy
+    gross_load_kw_df: pd.DataFrame
+    data_timezone: pd.DatetimeTZDtype
+    battery_spec_dict: Dict[str, float]
+    time_increaments_minutes: float
+
+    def __post_init__(self):
+        pass
+
+    def solve(self) -> pd.DataFrame:
+        if self.strategy == OptimizationStrategy.OPT1:
+            return \
+            self.top_bottom_smoothing_optimization()
+        if self.strategy == OptimizationStrategy.OPT2:
+            return \
+            self.some_other_optimization()
+        if self.strategy == OptimizationStrategy.OPT3:
+            return \
+            self.peak_shaving_level_optimization()
+        
+    def top_bottom_smoothing_optimization(self) -> pd.DataFrame:
+        """
+        In the interest of time I am going to make some simplifying
+        assumptions (it's gross, I hate it too :D)
+        First I assume that every day the battery starts 
+        with full soc and cycles once and ends the day with zero
+        full. In the worst case the solution is infeasible for 
+        the first day of the operations if soc is not full.
+        This restriction smoothes peaks on a daily basis. (which 
+        also smoothes the peak on the peakiest day of the month.)
+        This is not too restrictive in the real world, because usually a 
+        large battery cannot be economically justified to smooth on a 
+        monthly level. If we had a large battery,
+        then we could accumulate a whole lot of charge day after day for 
+        the "doomsday" of the month to have a super smoothing discharge. 
+        Even when the battery is large, 
+        the stored energy disipates over time, which is also not economical.
+        In most cases, we need to settle with daily smoothing anyways.
+
+        Second assumption, to make sure I schedule discharge 
+        only if the soc is positive, I require the battery to discharge
+        before noon and then charge after noon.
+
+        Third assumption, there is no lower or upper limit on the net load
+
+        Returns:
+            a dataframe containing the battery schedule.
+        """
+        minutes_to_fully_charge = \
+            (
+            self.battery_spec_dict['capacity_kwh']
+            /
+            # additional charge to account for the losses:
+            (self.battery_spec_dict['charge_efficiency_pct']/100)
+            /
+            self.battery_spec_dict['max_charge_rate_kw']
+            ) * 60 # hour to minutes
+        
+        minutes_to_fully_discharge = \
+            (
+            self.battery_spec_dict['capacity_kwh']
+            *
+            # reduced discharge to account for the losses
+            self.battery_spec_dict['discharge_efficiency_pct']/100
+            /
+            self.battery_spec_dict['max_discharge_rate_kw']
+            ) * 60 # hour to minutes
+        
+        cnt_blocks_of_time_to_charge = \
+            minutes_to_fully_charge / self.time_increaments_minutes
+        
+        cnt_blocks_of_time_to_discharge = \
+            minutes_to_fully_discharge / self.time_increaments_minutes
+
+        # now I choose the blocks of time based on the gross load.
+        # I choose the n highest loads of the hours before noon
+        # to charge (n = cnt_blocks_of_time_to_charge)
+        # and m lowest loads of the hours after noon
+        # to discharge (m = cnt_blocks_of_time_to_discharge)
+
+        # to schedule the battery for a day, date needs to be localized
+        self.gross_load_kw_df.loc[:, 'date'] = \
+            self.gross_load_kw_df.loc[:, 'datetime'].dt.\
+                tz_convert(self.data_timezone).dt.date
+
+        self.gross_load_kw_df.loc[:, 'hour_local'] = \
+            self.gross_load_kw_df.loc[:, 'datetime'].dt.\
+                tz_convert(self.data_timezone).dt.hour
+        
+        after_noon_loads_df = \
+            self.gross_load_kw_df[
+                self.gross_load_kw_df.loc[:, 'hour_local'] >= 13
+                ].copy() # we had to convert the datetime to local timezone to identify "noon"
+        morning_loads_df = \
+            self.gross_load_kw_df[
+                self.gross_load_kw_df.loc[:, 'hour_local'] < 13
+                ].copy()
+        
+
+        after_noon_loads_df.loc[:, 'rank'] = \
+            after_noon_loads_df.groupby('date')['actual_kwh']\
+                .rank(ascending=False, method='first')
+        
+        morning_loads_df.loc[:, 'rank'] = \
+            morning_loads_df.groupby('date')['actual_kwh']\
+                .rank(ascending=True, method='first')
+        
+        charge_df = \
+            after_noon_loads_df.loc[after_noon_loads_df.loc[:, 'rank'] 
+                             <= np.ceil(cnt_blocks_of_time_to_charge)]\
+                                .copy()
+        discharge_df = \
+            morning_loads_df.loc[morning_loads_df.loc[:, 'rank'] 
+                               <= np.ceil(cnt_blocks_of_time_to_discharge)]\
+                                .copy()
+        
+        charge_df.loc[:, 'charge_kw'] = \
+            -self.battery_spec_dict['max_charge_rate_kw']
+        discharge_df.loc[:, 'discharge_kw'] = \
+            self.battery_spec_dict['max_discharge_rate_kw']
+
+        # overwrite the last ranked time periods to account for fractional amount of
+        # periods that implies that we do not require full charge over the full period
+        reduced_charge_rate = \
+            np.ceil(cnt_blocks_of_time_to_charge) - cnt_blocks_of_time_to_charge
+        charge_df.loc[:, 'charge_kw'] = \
+            charge_df.apply(
+            lambda x: x['charge_kw'] * reduced_charge_rate
+            if x['rank'] == np.ceil(cnt_blocks_of_time_to_charge) 
+            else x['charge_kw'], axis=1)
+        
+        reduced_discharge_rate = \
+            np.ceil(cnt_blocks_of_time_to_discharge) - cnt_blocks_of_time_to_discharge
+        discharge_df.loc[:, 'discharge_kw'] = \
+            discharge_df.apply(
+            lambda x: x['discharge_kw'] * reduced_discharge_rate
+            if x['rank'] == np.ceil(cnt_blocks_of_time_to_discharge) 
+            else x['discharge_kw'], axis=1)
+        
+        # add energy columns
+        charge_df.loc[:, 'charge_kwh'] = \
+            charge_df.loc[:, 'charge_kw'] * \
+            self.time_increaments_minutes / 60
+        discharge_df.loc[:, 'discharge_kwh'] = \
+            discharge_df.loc[:, 'discharge_kw'] * \
+            self.time_increaments_minutes / 60
+
+        battery_plan = \
+            pd.concat([charge_df, discharge_df]).sort_values(by='datetime')
+        
+        # cosmetic changes:
+        battery_plan = battery_plan.fillna(0)\
+            .drop(columns=['rank', 'date', 'time_utc'])
+        battery_plan.rename(columns={'datetime': 'datetime_utc'}, inplace=True)
+        
+        return battery_plan
+
+    def peak_shaving_level_optimization(self) -> pd.DataFrame:
+        """
+        Instead of fixing the charge and discharge windows up front,
+        this strategy searches for the lowest net load cap (the "peak
+        shaving level") the battery can hold on each day. Any load above
+        the cap is discharged from the battery and any headroom below the
+        cap is used to charge it back, so a day can have several partial
+        cycles (second peaks) or almost none at all (flat days).
+
+        Same as top_bottom_smoothing_optimization(), every day is solved
+        on its own: the battery starts the day full and has to be full
+        again by the end of the day. For a given cap, the greedy
+        discharge-above/charge-below rule is the best the battery can do,
+        and it only gets easier as the cap goes up, so the cap is found
+        with a bisection. All the days are bisected together as rows of
+        a matrix, which keeps this vectorized like the ranking approach.
+
+        The plan uses the same columns and signs as
+        top_bottom_smoothing_optimization(): charge_kwh is negative and
+        lowers the net load (the peaks served from the battery) and
+        discharge_kwh is positive and raises it (refilling the battery).
+        The plan keeps every period, with zeros where the battery is idle.
+
+        Returns:
+            a dataframe containing the battery schedule.
+        """
+        tolerance_kwh = 1e-3
+
+        # to schedule the battery for a day, date needs to be localized
+        self.gross_load_kw_df.loc[:, 'date'] = \
+            self.gross_load_kw_df.loc[:, 'datetime'].dt.\
+                tz_convert(self.data_timezone).dt.date
+
+        self.gross_load_kw_df.loc[:, 'hour_local'] = \
+            self.gross_load_kw_df.loc[:, 'datetime'].dt.\
+                tz_convert(self.data_timezone).dt.hour
+
+        # lay the days out as rows of a (day x period of day) matrix.
+        # days with missing or extra periods (e.g. DST) are padded with nan
+        day_idx, _ = pd.factorize(self.gross_load_kw_df.loc[:, 'date'])
+        period_idx = \
+            self.gross_load_kw_df.groupby('date').cumcount().to_numpy()
+        load_matrix = \
+            np.full((day_idx.max() + 1, period_idx.max() + 1), np.nan)
+        load_matrix[day_idx, period_idx] = \
+            self.gross_load_kw_df.loc[:, 'actual_kwh'].to_numpy()
+
+        # the daily peak is always a feasible cap (nothing to shave),
+        # and no cap can go below the daily minimum load
+        lower_cap_kwh = np.nanmin(load_matrix, axis=1)
+        upper_cap_kwh = np.nanmax(load_matrix, axis=1)
+
+        cnt_iterations = int(np.ceil(np.log2(
+            max(np.max(upper_cap_kwh - lower_cap_kwh), tolerance_kwh)
+            / tolerance_kwh)))
+
+        for _ in range(cnt_iterations):
+            mid_cap_kwh = (lower_cap_kwh + upper_cap_kwh) / 2
+            _, _, is_feasible = self.simulate_peak_shaving(
+                load_matrix, mid_cap_kwh, tolerance_kwh)
+            upper_cap_kwh = np.where(is_feasible, mid_cap_kwh, upper_cap_kwh)
+            lower_cap_kwh = np.where(is_feasible, lower_cap_kwh, mid_cap_kwh)
+
+        shave_matrix, refill_matrix, _ = self.simulate_peak_shaving(
+            load_matrix, upper_cap_kwh, tolerance_kwh)
+
+        # the cap is only known within the tolerance, drop the dust
+        # it leaves behind (e.g. a tiny refill in the last period)
+        shave_matrix[np.abs(shave_matrix) < tolerance_kwh] = 0
+        refill_matrix[np.abs(refill_matrix) < tolerance_kwh] = 0
+
+        # map the matrices back to the timeseries
+        battery_plan = self.gross_load_kw_df.copy()
+        battery_plan.loc[:, 'charge_kwh'] = \
+            shave_matrix[day_idx, period_idx]
+        battery_plan.loc[:, 'discharge_kwh'] = \
+            refill_matrix[day_idx, period_idx]
+
+        # add power columns
+        battery_plan.loc[:, 'charge_kw'] = \
+            battery_plan.loc[:, 'charge_kwh'] * \
+            60 / self.time_increaments_minutes
+        battery_plan.loc[:, 'discharge_kw'] = \
+            battery_plan.loc[:, 'discharge_kwh'] * \
+            60 / self.time_increaments_minutes
+
+        # cosmetic changes:
+        battery_plan = battery_plan.drop(columns=['date', 'time_utc'])
+        battery_plan.rename(columns={'datetime': 'datetime_utc'}, inplace=True)
+
+        return battery_plan
+
+    def simulate_peak_shaving(self,
+                              load_matrix: np.ndarray,
+                              cap_kwh: np.ndarray,
+                              tolerance_kwh: float):
+        """
+        Runs the battery through every day (rows of load_matrix) at once,
+        serving whatever load is above the day's cap from the battery and
+        refilling it with whatever headroom is left below the cap, within
+        the rate, SoC and efficiency limits. Serving the peaks is limited
+        by the discharge specs and refilling by the charge specs.
+
+        Args:
+            load_matrix: gross load, one row per day, nan for no data
+            cap_kwh: net load cap of each day
+            tolerance_kwh: numerical slack for the feasibility check
+
+        Returns:
+            shave (negative) and refill (positive) matrices shaped as
+            load_matrix, and whether each day held its cap and ended
+            with a full battery
+        """
+        capacity_kwh = self.battery_spec_dict['capacity_kwh']
+        charge_efficiency = \
+            self.battery_spec_dict['charge_efficiency_pct']/100
+        discharge_efficiency = \
+            self.battery_spec_dict['discharge_efficiency_pct']/100
+        # rates to energy per time period
+        max_charge_kwh = \
+            self.battery_spec_dict['max_charge_rate_kw'] * \
+            self.time_increaments_minutes / 60
+        max_discharge_kwh = \
+            self.battery_spec_dict['max_discharge_rate_kw'] * \
+            self.time_increaments_minutes / 60
+
+        state_of_energy_kwh = np.full(load_matrix.shape[0], capacity_kwh)
+        unserved_kwh = np.zeros(load_matrix.shape[0])
+        shave_matrix = np.zeros(load_matrix.shape)
+        refill_matrix = np.zeros(load_matrix.shape)
+
+        for period in range(load_matrix.shape[1]):
+            # periods with no data leave the battery idle
+            excess_kwh = np.nan_to_num(
+                load_matrix[:, period] - cap_kwh, nan=0.0)
+
+            shave_kwh = np.minimum.reduce([
+                np.maximum(excess_kwh, 0),
+                np.full_like(excess_kwh, max_discharge_kwh),
+                state_of_energy_kwh * discharge_efficiency
+                ])
+            refill_kwh = np.minimum.reduce([
+                np.maximum(-excess_kwh, 0),
+                np.full_like(excess_kwh, max_charge_kwh),
+                (capacity_kwh - state_of_energy_kwh) / charge_efficiency
+                ])
+
+            state_of_energy_kwh = state_of_energy_kwh \
+                - shave_kwh / discharge_efficiency \
+                + refill_kwh * charge_efficiency
+            unserved_kwh += np.maximum(excess_kwh, 0) - shave_kwh
+
+            shave_matrix[:, period] = -shave_kwh
+            refill_matrix[:, period] = refill_kwh
+
+        is_feasible = \
+            (unserved_kwh <= tolerance_kwh) & \
+            (state_of_energy_kwh >= capacity_kwh - tolerance_kwh)
+
+        return shave_matrix, refill_matrix, is_feasible
+
+    def some_other_optimization(self) -> pd.DataFrame:
+        
+        return NotImplementedError
+    
+
+        
@@ -0,0 +1,25 @@
+# the modules below pull in pandas and pydantic, so they are only
+# imported the first time one of their names is used. This keeps
+# `from .src.strategy_type import OptimizationStrategy` cheap for the cli
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data_prep import DataPrep
+    from .battery import Battery
+    from .strategy_type import OptimizationStrategy
+
+_LAZY_IMPORTS = {
+    'DataPrep': '.data_prep',
+    'Battery': '.battery',
+    'OptimizationStrategy': '.strategy_type',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
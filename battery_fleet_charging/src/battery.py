@@ -3,7 +3,6 @@ from pydantic import BaseModel, validator, ValidationError
 from dataclasses import dataclass, field
 from typing import Dict, List
 import logging
-logging.basicConfig(level=logging.DEBUG)
 
 # repo dependencies
 import pandas as pd
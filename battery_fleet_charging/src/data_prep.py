@@ -2,7 +2,6 @@
 from pydantic import BaseModel, validator, ValidationError
 from typing import Dict, List
 import logging
-logging.basicConfig(level=logging.DEBUG)
 
 # repo dependencies
 import pandas as pd
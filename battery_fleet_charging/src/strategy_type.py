@@ -0,0 +1,14 @@
+from enum import Enum, auto
+
+class OptimizationStrategy(Enum):
+    OPT1 = auto()
+    OPT2 = auto() # placeholder, see Optimizers.some_other_optimization()
+    OPT3 = auto() # daily peak shaving level search
+    
+    @classmethod
+    def __contains__(cls, item): 
+        return isinstance(item, cls)
+
+    @property
+    def is_implemented(self) -> bool:
+        return self is not OptimizationStrategy.OPT2
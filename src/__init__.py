@@ -1,3 +0,0 @@
-from .data_prep import DataPrep
-from .battery import Battery
-from .strategy_type import OptimizationStrategy
\ No newline at end of file